@@ -1,231 +1,1273 @@
 import os
+import argparse
+import errno
+import io
+import mmap
 import shutil
-from collections import defaultdict
+import sqlite3
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import closing, contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import exifread
+from functools import lru_cache
+from itertools import chain
+import numpy as np
 from pathlib import Path
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the decorated function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm is optional; without it only the per-phase log lines are shown
+
+    def tqdm(iterable, **kwargs):
+        """Stand-in for tqdm that returns the iterable without drawing a progress bar."""
+        return iterable
+
+try:
+    import pyexiv2
+    pyexiv2.set_log_level(3)  # Files without EXIF are routine; only surface libexiv2 errors
+except ImportError:  # pyexiv2 is optional; exifread then handles everything the fast path doesn't
+    pyexiv2 = None
+
 API_KEY = "YOUR_GOOGLE_MAPS_API_KEY"  # Replace with your actual API key
+GEOCODE_WORKERS = 10  # Concurrent Geocoding API requests
+GEOCODE_MAX_QPS = 40  # Request rate cap across all workers, under Google's 50 QPS limit
 
 # Set up logging for debugging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Persistent cache, stored inside the source folder
+CACHE_DB_NAME = '.geogallery_cache.db'
+# Geocoding results are shared by every photo folder, so they live in a per-user cache
+# ($XDG_CACHE_HOME or ~/.cache)/geogallery/geocode.sqlite, resolved when a sorter opens it
+GEOCODE_CACHE_NAME = Path('geogallery') / 'geocode.sqlite'
+CACHE_COMMIT_BATCH = 500  # Rows written per transaction when persisting EXIF metadata
+
+COORD_SCALE = 10000  # Coordinates are rounded to 4 decimals, so they're exact integers in 1e-4 degree units
+NO_LOCATION_CELL = np.iinfo(np.int64).max  # Grid key of photos without GPS; sorts after every real cell
+
+# Metadata extracted (and cached) for one photo: rounded (lat, lon) or None, and the date taken
+ExifInfo = namedtuple('ExifInfo', ['coordinates', 'date_taken'])
+
+# Photo file extensions the sorter picks up, compared case-insensitively
+PHOTO_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.raw', '.cr2', '.nef', '.arw', '.heic'})
+_PHOTO_SUFFIXES = tuple(PHOTO_EXTENSIONS)  # For str.endswith, which checks them all in one C-level call
+# Last characters of those extensions, in either case: a cheap first filter for directory entries
+_PHOTO_LAST_CHARS = frozenset(c for ext in PHOTO_EXTENSIONS for c in (ext[-1], ext[-1].upper()))
+
+# EXIF fast path: JPEG, TIFF-container, PNG and HEIC files are parsed by hand, everything else goes through exifread
+JPEG_EXTENSIONS = {'.jpg', '.jpeg'}
+TIFF_EXTENSIONS = {'.tif', '.tiff', '.cr2', '.nef', '.arw'}  # Files that start with a TIFF header
+PNG_EXTENSIONS = {'.png'}
+HEIC_EXTENSIONS = {'.heic'}
+HEIC_META_LIMIT = 1024 * 1024  # Largest HEIC 'meta' box read into memory (it is a few KiB in practice)
+EXIF_WINDOW = 64 * 1024  # EXIF metadata virtually always sits in the first 64 KiB
+EXIFREAD_PREFIX = 256 * 1024  # Bytes read in one go for exifread before it may touch the rest of the file
+EXIF_BRUTEFORCE = True  # Retry with exifread when the fast path can't locate/parse EXIF
+EXIF_PREFETCH_BATCH = 32  # Files per worker task whose EXIF windows are read ahead together
+
+MOVE_COPY_CHUNK = 4 * 1024 * 1024  # Bytes per copy call when a move has to cross filesystems
+MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Concurrent moves; each is a few metadata syscalls
+MOVE_WINDOW = 4 * MOVE_WORKERS  # Moves queued ahead of the oldest unfinished one
+# os.link unsupported here: EPERM on Linux FAT/exFAT, ENOTSUP on macOS ones, EINVAL on Windows FAT
+_NO_HARDLINK_ERRNOS = {errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOSYS, errno.EINVAL}
+
+# TIFF tag IDs read by the fast path
+_TAG_DATETIME = 0x0132
+_TAG_EXIF_IFD = 0x8769
+_TAG_GPS_IFD = 0x8825
+_TAG_DATETIME_ORIGINAL = 0x9003
+_GPS_LATITUDE_REF, _GPS_LATITUDE, _GPS_LONGITUDE_REF, _GPS_LONGITUDE = 1, 2, 3, 4
+_GPS_TAGS = (_GPS_LATITUDE_REF, _GPS_LATITUDE, _GPS_LONGITUDE_REF, _GPS_LONGITUDE)
+
+# Formats tried by strptime for timestamps that aren't in the fixed-width layout
+_EXIF_DATE_FORMATS = ('%Y:%m:%d %H:%M:%S', '%Y-%m-%d %H:%M:%S')
+# exifread tag names for the capture date, in order of preference
+_EXIFREAD_DATE_TAGS = ('EXIF DateTimeOriginal', 'EXIF DateTime', 'Image DateTime')
+
+# pyexiv2 (libexiv2) keys for the same tags
+_EXIV2_DATE_TAGS = ('Exif.Photo.DateTimeOriginal', 'Exif.Image.DateTime')
+_EXIV2_GPS_TAGS = (
+    'Exif.GPSInfo.GPSLatitude', 'Exif.GPSInfo.GPSLatitudeRef',
+    'Exif.GPSInfo.GPSLongitude', 'Exif.GPSInfo.GPSLongitudeRef',
+)
+
+# Precompiled structs for the fast path, keyed by TIFF byte order
+_UINT16 = {e: struct.Struct(e + 'H') for e in '<>'}
+_TIFF_HEADER = {e: struct.Struct(e + 'HI') for e in '<>'}  # magic, IFD0 offset
+_IFD_ENTRY = {e: struct.Struct(e + 'HHII') for e in '<>'}  # tag, type, count, value/offset
+_RATIONAL3 = {e: struct.Struct(e + '6I') for e in '<>'}
+_SEGMENT_LENGTH = struct.Struct('>H')  # JPEG segment lengths are always big-endian
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_CHUNK_HEADER = struct.Struct('>I4s')  # length, type
+_PNG_TEXT_CHUNKS = {b'tEXt', b'zTXt', b'iTXt'}
+_PNG_EXIF_PROFILE_KEYWORDS = {b'Raw profile type exif', b'Raw profile type APP1'}  # Legacy EXIF in text
+_BOX_HEADER = struct.Struct('>I4s')  # ISO BMFF (HEIC) box size, type
+_UINT64_BE = struct.Struct('>Q')  # ISO BMFF 64-bit box size
+
+
+@njit('float64(int64, int64, int64, int64, int64, int64)', cache=True)
+def _dms_to_degrees(dn, dd, mn, md, sn, sd):
+    """Convert DMS rationals, given as numerator/denominator pairs, to decimal degrees.
+
+    Zero denominators mark unused fields and count as 0, like exifread does.
+    Compiled eagerly for the one signature the EXIF readers call it with, so
+    no worker pays for type inference on its first photo.
+    """
+    degrees = dn / dd if dd else 0.0
+    minutes = mn / md if md else 0.0
+    seconds = sn / sd if sd else 0.0
+    return degrees + minutes / 60.0 + seconds / 3600.0
+
+
+@lru_cache(maxsize=4096)
+def _rationals_to_degrees(rationals):
+    """Memoized `_dms_to_degrees`, keyed on the raw (num, den) x 3 tuple.
+
+    Burst shots carry identical GPS rationals, so most lookups skip the divisions.
+    """
+    return _dms_to_degrees(*rationals)
+
+
+def _convert_to_degrees(value):
+    """Convert GPS coordinates from DMS to decimal degrees.
+
+    Args:
+        value (list[float]): Degrees, minutes, seconds as returned by exifread
+            with builtin_types=True.
+
+    Returns:
+        float: Decimal degrees.
+    """
+    d, m, s = value
+    return d + m/60.0 + s/3600.0
+
+
+@lru_cache(maxsize=None)
+def _coordinate_name(coordinates):
+    """Format rounded (lat, lon) as a folder name, once per distinct coordinate."""
+    lat, lon = coordinates
+    lat_dir = "N" if lat >= 0 else "S"
+    lon_dir = "E" if lon >= 0 else "W"
+    return f"{abs(lat):.4f}{lat_dir}_{abs(lon):.4f}{lon_dir}"
+
+
+def _parse_exif_date(value):
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp, returning None if malformed.
+
+    Also accepts the 'YYYY-MM-DD HH:MM:SS' form exifread produces with
+    builtin_types=True. Well-formed fixed-width values are sliced at their
+    offsets instead of going through strptime's regex machinery; anything
+    else (unpadded fields, other whitespace) still goes through strptime.
+    """
+    if not isinstance(value, str):
+        return None
+    return _parse_exif_timestamp(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_exif_timestamp(value):
+    """Memoized body of `_parse_exif_date` for string values.
+
+    Burst shots share their timestamp to the second, so repeats skip the parse.
+    """
+    if (len(value) == 19 and value[4] in ':-' and value[7] in ':-' and value[10] == ' '
+            and value[13] == ':' and value[16] == ':' and value[0:4].isdigit() and value[5:7].isdigit()
+            and value[8:10].isdigit() and value[11:13].isdigit() and value[14:16].isdigit()
+            and value[17:19].isdigit()):
+        try:
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]))
+        except ValueError:
+            return None  # Out-of-range field, which strptime rejects as well
+    for date_format in _EXIF_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=256)
+def _ifd_tags_struct(endian, count):
+    """Struct that unpacks just the tag IDs of an IFD's `count` 12-byte entries."""
+    return struct.Struct(endian + 'H10x' * count)
+
+
+def _read_ifd(buf, tiff, offset, endian, wanted):
+    """Decode the wanted tags' entries from a TIFF IFD.
+
+    All of the IFD's tag IDs come out of a single struct call and are searched
+    in C, so only the wanted entries are unpacked from Python.
+
+    Args:
+        buf (bytes | mmap.mmap): Buffer holding the TIFF block.
+        tiff (int): Offset of the TIFF header within buf; IFD offsets are relative to it.
+        offset (int): IFD offset relative to the TIFF header.
+        endian (str): struct byte-order prefix ('<' or '>').
+        wanted (tuple[int, ...]): Tag IDs to look for.
+
+    Returns:
+        dict[int, tuple[int, int, int, int]]: Tag ID -> (field type, count,
+            value/offset field, absolute offset of the 12-byte entry).
+    """
+    start = tiff + offset
+    (count,) = _UINT16[endian].unpack_from(buf, start)
+    first = start + 2
+    tags = _ifd_tags_struct(endian, count).unpack_from(buf, first)
+    read_entry = _IFD_ENTRY[endian].unpack_from
+    entries = {}
+    for tag in wanted:
+        if tag in tags:
+            entry = first + 12 * tags.index(tag)
+            _, field_type, value_count, value = read_entry(buf, entry)
+            entries[tag] = (field_type, value_count, value, entry)
+    return entries
+
+
+def _read_ifd_ascii(buf, tiff, field):
+    """Read an ASCII IFD value, which is stored inline when it fits in 4 bytes."""
+    _, count, value, entry = field
+    start = entry + 8 if count <= 4 else tiff + value
+    if start + count > len(buf):
+        raise ValueError("ASCII value runs past the end of the buffer")
+    return buf[start:start + count].split(b'\x00', 1)[0].decode('ascii')
+
+
+def _read_ifd_degrees(buf, tiff, field, endian):
+    """Read a GPS DMS rational triplet and convert it straight to decimal degrees."""
+    field_type, count, value, _ = field
+    if field_type != 5 or count != 3:  # The EXIF spec fixes GPSLatitude/Longitude as 3 RATIONALs
+        raise ValueError(f"Unexpected GPS field of type {field_type}, count {count}")
+    return _rationals_to_degrees(_RATIONAL3[endian].unpack_from(buf, tiff + value))
+
+
+def _parse_tiff_exif(buf, tiff):
+    """Pull GPS coordinates and the capture date out of a TIFF-structured EXIF block.
+
+    Only IFD0, the GPS IFD and the Exif IFD are visited, and within them only
+    the handful of tags needed here are decoded.
+
+    Args:
+        buf (bytes | mmap.mmap): Buffer holding the TIFF block.
+        tiff (int): Offset of the TIFF header within buf.
+
+    Returns:
+        tuple[tuple[float, float] | None, datetime | None]: Rounded (lat, lon) and
+            date taken; either is None when absent.
+
+    Raises:
+        struct.error | ValueError: If the block is malformed or truncated.
+    """
+    byte_order = buf[tiff:tiff + 2]
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        raise ValueError("Invalid TIFF byte order")
+
+    magic, ifd0_offset = _TIFF_HEADER[endian].unpack_from(buf, tiff + 2)
+    if magic != 42:
+        raise ValueError("Invalid TIFF magic number")
+
+    ifd0 = _read_ifd(buf, tiff, ifd0_offset, endian, (_TAG_GPS_IFD, _TAG_EXIF_IFD, _TAG_DATETIME))
+
+    coordinates = None
+    if _TAG_GPS_IFD in ifd0:
+        gps = _read_ifd(buf, tiff, ifd0[_TAG_GPS_IFD][2], endian, _GPS_TAGS)
+        if len(gps) == len(_GPS_TAGS):
+            lat = _read_ifd_degrees(buf, tiff, gps[_GPS_LATITUDE], endian)
+            if _read_ifd_ascii(buf, tiff, gps[_GPS_LATITUDE_REF]) != 'N':
+                lat = -lat
+
+            lon = _read_ifd_degrees(buf, tiff, gps[_GPS_LONGITUDE], endian)
+            if _read_ifd_ascii(buf, tiff, gps[_GPS_LONGITUDE_REF]) != 'E':
+                lon = -lon
+
+            # Round to reduce precision for grouping (approximately 11m accuracy)
+            coordinates = (round(lat, 4), round(lon, 4))
+
+    # Prefer DateTimeOriginal from the Exif IFD, then IFD0's DateTime
+    date_taken = None
+    if _TAG_EXIF_IFD in ifd0:
+        exif_ifd = _read_ifd(buf, tiff, ifd0[_TAG_EXIF_IFD][2], endian, (_TAG_DATETIME_ORIGINAL,))
+        if _TAG_DATETIME_ORIGINAL in exif_ifd:
+            date_taken = _parse_exif_date(_read_ifd_ascii(buf, tiff, exif_ifd[_TAG_DATETIME_ORIGINAL]))
+    if date_taken is None and _TAG_DATETIME in ifd0:
+        date_taken = _parse_exif_date(_read_ifd_ascii(buf, tiff, ifd0[_TAG_DATETIME]))
+
+    return coordinates, date_taken
+
+
+def _find_jpeg_exif(buf):
+    """Walk JPEG segment headers to the APP1 'Exif' segment.
+
+    Only the 4-byte marker/length headers are read while hopping from segment
+    to segment, so no segment payload is copied.
+
+    Args:
+        buf (bytes | mmap.mmap): Start of the JPEG file.
+
+    Returns:
+        int | None: Offset of the TIFF header inside the EXIF segment, or None if
+            image data starts without one.
+
+    Raises:
+        IndexError | struct.error | ValueError: If the segment headers can't be
+            followed within the buffer.
+    """
+    if buf[:2] != b'\xff\xd8':
+        raise ValueError("Missing JPEG SOI marker")
+
+    pos = 2
+    while True:
+        if buf[pos] != 0xFF:
+            raise ValueError("Lost JPEG segment sync")
+        marker = buf[pos + 1]
+        if marker == 0xFF:  # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in (0xDA, 0xD9):  # Image data starts: no EXIF segment in this file
+            return None
+        (length,) = _SEGMENT_LENGTH.unpack_from(buf, pos + 2)
+        if marker == 0xE1 and buf[pos + 4:pos + 10] == b'Exif\x00\x00':
+            return pos + 10
+        pos += 2 + length
+
+
+@contextmanager
+def _map_exif_window(f):
+    """Memory-map the first EXIF_WINDOW bytes of an open file, yielding None if it is empty.
+
+    On filesystems that can't map files (some FUSE and network mounts), the
+    window is read into a bytes object instead.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if not size:
+        yield None
+        return
+    try:
+        buf = mmap.mmap(f.fileno(), min(EXIF_WINDOW, size), access=mmap.ACCESS_READ)
+    except OSError:
+        f.seek(0)
+        yield f.read(EXIF_WINDOW)
+        return
+    with buf:
+        yield buf
+
+
+def _read_jpeg_exif(f):
+    """Parse GPS and date directly from a JPEG's EXIF APP1 segment.
+
+    Memory-maps the first EXIF_WINDOW bytes, locates the EXIF segment with
+    `_find_jpeg_exif`, and hands its TIFF block to `_parse_tiff_exif`; all reads
+    go through struct.unpack_from against the map.
+
+    Args:
+        f (BinaryIO): The JPEG, opened for binary reading.
+
+    Returns:
+        tuple | None: (coordinates, date_taken) as in `_parse_tiff_exif`, with both
+            None if the JPEG carries no EXIF; None if the segment couldn't be
+            located or parsed within the window.
+    """
+    with _map_exif_window(f) as buf:
+        if buf is None:
+            return None
+        try:
+            tiff = _find_jpeg_exif(buf)
+            if tiff is None:
+                return None, None
+            return _parse_tiff_exif(buf, tiff)
+        except (IndexError, struct.error, ValueError, UnicodeDecodeError):
+            return None
+
+
+def _read_tiff_exif(f):
+    """Parse GPS and date directly from a TIFF-container file (TIFF, CR2, NEF, ARW).
+
+    These formats start with the TIFF header, so IFD0 is read straight from
+    the memory-mapped window. A file without a GPSInfo pointer in IFD0 is
+    settled after that one 12-byte-entry scan (plus the date lookup), without
+    exifread walking its remaining IFDs.
+
+    Args:
+        f (BinaryIO): The image, opened for binary reading.
+
+    Returns:
+        tuple | None: (coordinates, date_taken) as in `_parse_tiff_exif`, or None
+            if the header couldn't be parsed within the window.
+    """
+    with _map_exif_window(f) as buf:
+        if buf is None:
+            return None
+        try:
+            return _parse_tiff_exif(buf, 0)
+        except (IndexError, struct.error, ValueError, UnicodeDecodeError):
+            return None
+
+
+def _parse_exiv2_degrees(value):
+    """Convert an exiv2 DMS string such as '30/1 15/1 442/100' to decimal degrees."""
+    rationals = []
+    for part in value.split():
+        numerator, _, denominator = part.partition('/')
+        rationals += (int(numerator), int(denominator or 1))
+    return _rationals_to_degrees(tuple(rationals))
+
+
+def _read_exif_with_pyexiv2(image_path):
+    """Extract GPS coordinates and date via the libexiv2 C++ binding, if installed.
+
+    Used ahead of exifread for files the fast path doesn't cover, since the
+    native parser is much cheaper per file than exifread's interpreted walk.
+
+    Args:
+        image_path (str | Path): Path to the image.
+
+    Returns:
+        tuple | None: (coordinates, date_taken) as in `_read_exif_with_exifread`,
+            or None if pyexiv2 isn't installed or can't read the file.
+    """
+    if pyexiv2 is None:
+        return None
+    try:
+        img = pyexiv2.Image(os.fspath(image_path))
+        try:
+            tags = img.read_exif()
+        finally:
+            img.close()
+    except (RuntimeError, OSError) as e:
+        logger.debug(f"pyexiv2 couldn't read {os.path.basename(image_path)}: {e}")
+        return None
+
+    coordinates = None
+    gps_lat, gps_lat_ref, gps_lon, gps_lon_ref = (tags.get(tag) for tag in _EXIV2_GPS_TAGS)
+    if gps_lat and gps_lat_ref and gps_lon and gps_lon_ref:
+        try:
+            lat = _parse_exiv2_degrees(gps_lat)
+            if gps_lat_ref != 'N':
+                lat = -lat
+            lon = _parse_exiv2_degrees(gps_lon)
+            if gps_lon_ref != 'E':
+                lon = -lon
+            coordinates = (round(lat, 4), round(lon, 4))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Error converting GPS coordinates for {os.path.basename(image_path)}: {e}")
+
+    date_taken = None
+    for tag_name in _EXIV2_DATE_TAGS:
+        date_taken = _parse_exif_date(tags.get(tag_name))
+        if date_taken is not None:
+            break
+
+    return coordinates, date_taken
+
+
+class _PrefixBuffer(io.BytesIO):
+    """In-memory file prefix that notes whether a reader ran off its end."""
+
+    overrun = False
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if size is None or size < 0 or len(data) < size:
+            self.overrun = True
+        return data
+
+
+def _exifread_tags_incomplete(tags):
+    """Check whether exifread tags lack something a full parse might find.
+
+    True when no date tag is present, or when IFD0 points at a GPS or Exif
+    sub-IFD none of whose tags were read.
+
+    Args:
+        tags (dict): Tags returned by `exifread.process_file`.
+
+    Returns:
+        bool: True if the file should be parsed again in full.
+    """
+    if not any(tag_name in tags for tag_name in _EXIFREAD_DATE_TAGS):
+        return True
+    if 'Image GPSInfo' in tags and not any(k.startswith('GPS ') for k in tags):
+        return True
+    return 'Image ExifOffset' in tags and not any(k.startswith('EXIF ') for k in tags)
+
+
+def _read_exif_with_exifread(f, image_path):
+    """Extract GPS coordinates and date from any supported format via exifread.
+
+    Uses exifread with minimal details to reduce overhead, and builtin_types so
+    tags arrive as plain floats and strings rather than IfdTag/Ratio wrappers.
+    Parsing stops at DateTimeOriginal: IFD0 (with its GPS sub-IFD) is read in
+    full before the Exif IFD, so nothing needed here lies past that tag.
+    exifread first parses the leading EXIFREAD_PREFIX bytes from memory, so
+    its many small reads and seeks cost one read of the caller's handle
+    (falling back from the fast path doesn't open the file a second time).
+    The whole file is parsed only when that pass reached past the prefix and
+    came back without a needed tag (see `_exifread_tags_incomplete`), e.g. a
+    TIFF whose GPS IFD sits after the image data; a file settled inside the
+    prefix, with or without EXIF, is parsed once. exifread is imported on first use: JPEG/TIFF files never
+    need it, so extraction workers fed only those formats skip the import.
+
+    Args:
+        f (BinaryIO): The image, opened for binary reading.
+        image_path (str | Path): Path to the image, used in log messages.
+
+    Returns:
+        tuple[tuple[float, float] | None, datetime | None]: Rounded (lat, lon) and
+            date taken; either is None when absent.
+    """
+    import exifread
+
+    def process(fh):
+        # Extract all relevant tags in one pass for performance
+        return exifread.process_file(
+            fh,
+            stop_tag='DateTimeOriginal',
+            details=False,
+            extract_thumbnail=False,
+            builtin_types=True
+        )
+
+    f.seek(0)
+    head = _PrefixBuffer(f.read(EXIFREAD_PREFIX))
+    if len(head.getbuffer()) < EXIFREAD_PREFIX:
+        tags = process(head)  # The prefix is the whole file
+    else:
+        try:
+            tags = process(head)
+        except Exception:
+            tags = None  # Metadata ran past the prefix
+        if tags is None or (head.overrun and _exifread_tags_incomplete(tags)):
+            f.seek(0)
+            tags = process(f)
+
+    # Extract GPS coordinates
+    coordinates = None
+    gps_lat = tags.get('GPS GPSLatitude')
+    gps_lat_ref = tags.get('GPS GPSLatitudeRef')
+    gps_lon = tags.get('GPS GPSLongitude')
+    gps_lon_ref = tags.get('GPS GPSLongitudeRef')
+
+    if gps_lat and gps_lat_ref and gps_lon and gps_lon_ref:
+        try:
+            # Convert GPS coordinates to decimal degrees
+            lat = _convert_to_degrees(gps_lat)
+            if gps_lat_ref != 'N':
+                lat = -lat
+
+            lon = _convert_to_degrees(gps_lon)
+            if gps_lon_ref != 'E':
+                lon = -lon
+
+            # Round to reduce precision for grouping (approximately 11m accuracy)
+            coordinates = (round(lat, 4), round(lon, 4))
+        except Exception as e:
+            logger.warning(f"Error converting GPS coordinates for {os.path.basename(image_path)}: {e}")
+
+    # Extract date
+    date_taken = None
+    for tag_name in _EXIFREAD_DATE_TAGS:
+        date_taken = _parse_exif_date(tags.get(tag_name))
+        if date_taken is not None:
+            break
+
+    return coordinates, date_taken
+
+
+def _read_png_exif(f):
+    """Parse GPS and date directly from a PNG's eXIf chunk.
+
+    Hops from chunk header to chunk header (8 bytes each), reading no payload
+    but a text chunk's keyword, so a PNG without an eXIf chunk (screenshots,
+    exports) is settled without a full metadata parser. The eXIf payload is a
+    bare TIFF block and goes to `_parse_tiff_exif`. A PNG whose only EXIF may
+    be a legacy "Raw profile type exif"/"APP1" text chunk is left to pyexiv2,
+    the one fallback that reads those; without pyexiv2 it counts as EXIF-less.
+
+    Args:
+        f (BinaryIO): The PNG, opened for binary reading.
+
+    Returns:
+        tuple | None: (coordinates, date_taken) as in `_parse_tiff_exif`, with both
+            None if the PNG carries no EXIF; None if it isn't a PNG, its chunks
+            can't be followed, or it may hold EXIF outside an eXIf chunk.
+    """
+    try:
+        if f.read(8) != _PNG_SIGNATURE:
+            return None
+        has_exif_profile = False
+        while True:
+            length, chunk_type = _PNG_CHUNK_HEADER.unpack(f.read(8))
+            if chunk_type == b'eXIf':
+                return _parse_tiff_exif(f.read(length), 0)
+            if chunk_type == b'IEND':
+                return None if has_exif_profile else (None, None)
+            skip = length
+            if chunk_type in _PNG_TEXT_CHUNKS and pyexiv2 is not None:
+                head = f.read(min(length, 80))  # Keyword (1-79 bytes) and its NUL
+                skip -= len(head)
+                has_exif_profile = has_exif_profile or head.split(b'\0', 1)[0] in _PNG_EXIF_PROFILE_KEYWORDS
+            f.seek(skip + 4, os.SEEK_CUR)  # Rest of the payload and CRC
+    except (IndexError, struct.error, ValueError, UnicodeDecodeError):
+        return None
+
+
+def _read_uint(buf, pos, size):
+    """Read a big-endian unsigned integer of `size` bytes (0 reads as 0) from buf."""
+    if pos + size > len(buf):
+        raise ValueError("Truncated ISO BMFF field")
+    return int.from_bytes(buf[pos:pos + size], 'big')
+
+
+def _iter_boxes(buf, start, end):
+    """Yield (type, payload start, payload end) for each ISO BMFF box in buf[start:end]."""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = _BOX_HEADER.unpack_from(buf, pos)
+        header = 8
+        if size == 1:
+            (size,) = _UINT64_BE.unpack_from(buf, pos + 8)
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise ValueError("Truncated ISO BMFF box")
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def _read_heic_meta(f):
+    """Return the payload of a HEIC file's top-level 'meta' box, hopping over the others.
+
+    Returns:
+        bytes | None: The payload, or None if the file doesn't start with an
+            'ftyp' box or has no 'meta' box.
+
+    Raises:
+        struct.error | ValueError: If the box headers can't be followed.
+    """
+    first = True
+    while True:
+        size, box_type = _BOX_HEADER.unpack(f.read(8))
+        header = 8
+        if size == 1:
+            (size,) = _UINT64_BE.unpack(f.read(8))
+            header = 16
+        if first and box_type != b'ftyp':
+            return None
+        first = False
+        if box_type == b'meta':
+            if not header < size <= HEIC_META_LIMIT:
+                raise ValueError("Unsupported HEIC meta box size")
+            return f.read(size - header)
+        if size == 0:  # Last box, running to the end of the file
+            return None
+        if size < header:
+            raise ValueError("Truncated ISO BMFF box")
+        f.seek(size - header, os.SEEK_CUR)
+
+
+def _heic_exif_item_id(meta, start, end):
+    """Find the item ID of the 'Exif' entry in an 'iinf' box, or None if there is none."""
+    version = meta[start]
+    pos = start + 4 + (2 if version == 0 else 4)  # version/flags, entry_count
+    for box_type, payload, _ in _iter_boxes(meta, pos, end):
+        if box_type != b'infe' or meta[payload] < 2:
+            continue  # Version 0/1 entries predate item types
+        id_size = 2 if meta[payload] == 2 else 4
+        item_id = _read_uint(meta, payload + 4, id_size)
+        if meta[payload + 6 + id_size:payload + 10 + id_size] == b'Exif':  # After item_protection_index
+            return item_id
+    return None
+
+
+def _heic_item_location(meta, start, end, item_id):
+    """Find an item's construction method and (offset, length) extents in an 'iloc' box.
+
+    Returns:
+        tuple[int, list[tuple[int, int]]] | None: The construction method (0:
+            file offsets, 1: offsets into 'idat') and extents, or None if the
+            item isn't listed.
+    """
+    version = meta[start]
+    pos = start + 4
+    offset_size, length_size = meta[pos] >> 4, meta[pos] & 0x0F
+    base_offset_size = meta[pos + 1] >> 4
+    index_size = meta[pos + 1] & 0x0F if version in (1, 2) else 0
+    pos += 2
+    id_size = 2 if version < 2 else 4
+    item_count = _read_uint(meta, pos, id_size)
+    pos += id_size
+    for _ in range(item_count):
+        current_id = _read_uint(meta, pos, id_size)
+        pos += id_size
+        method = 0
+        if version in (1, 2):
+            method = _read_uint(meta, pos, 2) & 0x0F
+            pos += 2
+        pos += 2  # data_reference_index
+        base_offset = _read_uint(meta, pos, base_offset_size)
+        pos += base_offset_size
+        extent_count = _read_uint(meta, pos, 2)
+        pos += 2
+        extents = []
+        for _ in range(extent_count):
+            pos += index_size
+            extent_offset = _read_uint(meta, pos, offset_size)
+            extent_length = _read_uint(meta, pos + offset_size, length_size)
+            pos += offset_size + length_size
+            extents.append((base_offset + extent_offset, extent_length))
+        if current_id == item_id:
+            return method, extents
+    return None
+
+
+def _read_heic_exif(f):
+    """Parse GPS and date directly from a HEIC file's Exif item.
+
+    Reads only the top-level box headers and the 'meta' box, finds the Exif
+    item through its 'iinf' entry and 'iloc' extents, and reads just those
+    bytes. The item is a 4-byte offset followed by the TIFF block, which goes
+    to `_parse_tiff_exif`.
+
+    Args:
+        f (BinaryIO): The HEIC file, opened for binary reading.
+
+    Returns:
+        tuple | None: (coordinates, date_taken) as in `_parse_tiff_exif`, with both
+            None if the file has no Exif item; None if it isn't a HEIC file or
+            its boxes couldn't be parsed here.
+    """
+    try:
+        meta = _read_heic_meta(f)
+        if meta is None:
+            return None
+        boxes = {box_type: (start, end) for box_type, start, end in _iter_boxes(meta, 4, len(meta))}
+        if b'iinf' not in boxes or b'iloc' not in boxes:
+            return None
+        item_id = _heic_exif_item_id(meta, *boxes[b'iinf'])
+        if item_id is None:
+            return None, None
+        location = _heic_item_location(meta, *boxes[b'iloc'], item_id)
+        if location is None:
+            return None
+        method, extents = location
+        if method == 0:
+            chunks = []
+            for offset, length in extents:
+                f.seek(offset)
+                chunks.append(f.read(length))
+            data = b''.join(chunks)
+        elif method == 1 and b'idat' in boxes:
+            idat = boxes[b'idat'][0]
+            data = b''.join(meta[idat + offset:idat + offset + length] for offset, length in extents)
+        else:
+            return None
+        return _parse_tiff_exif(data, 4 + _read_uint(data, 0, 4))
+    except (IndexError, struct.error, ValueError, UnicodeDecodeError):
+        return None
+
+
+# Hand-rolled EXIF reader per file extension; other formats go straight to pyexiv2/exifread
+_FAST_PATH_READERS = {
+    **dict.fromkeys(JPEG_EXTENSIONS, _read_jpeg_exif),
+    **dict.fromkeys(TIFF_EXTENSIONS, _read_tiff_exif),
+    **dict.fromkeys(PNG_EXTENSIONS, _read_png_exif),
+    **dict.fromkeys(HEIC_EXTENSIONS, _read_heic_exif),
+}
+
+
+def extract_exif_data(image_path, mtime=None):
+    """Extract both GPS coordinates and date from EXIF data in a single pass.
+
+    JPEG, TIFF-container, PNG and HEIC files go through the hand-rolled parser
+    registered for their extension in _FAST_PATH_READERS; other formats, and
+    files the fast path can't make sense of (when EXIF_BRUTEFORCE is on), go
+    through pyexiv2 when it is installed and exifread otherwise (or if pyexiv2
+    can't read the file). The fast path and exifread share one open handle;
+    pyexiv2 opens the file again by path, since libexiv2 can't take a Python
+    file object. Coordinates are rounded to 4 decimals to stabilize grouping
+    (~11m). Lives at module level so it can be dispatched to worker processes.
+
+    Args:
+        image_path (str | Path): Path to the image.
+        mtime (float | None): The file's st_mtime if the caller already has it,
+            so the date fallback doesn't stat the file again.
+
+    Returns:
+        ExifInfo: Rounded (lat, lon) or None, and date_taken. Falls back to file
+            modification time if EXIF date is missing.
+    """
+    try:
+        metadata = None
+        reader = _FAST_PATH_READERS.get(os.path.splitext(image_path)[1].lower())
+        with open(image_path, 'rb') as f:
+            if reader is not None:
+                metadata = reader(f)
+            if metadata is None and (EXIF_BRUTEFORCE or reader is None):
+                metadata = _read_exif_with_pyexiv2(image_path)
+                if metadata is None:
+                    metadata = _read_exif_with_exifread(f, image_path)
+        coordinates, date_taken = metadata or (None, None)
+
+    except Exception as e:
+        logger.warning(f"Error reading EXIF from {os.path.basename(image_path)}: {e}")
+        coordinates, date_taken = None, None
+
+    # Fallback to file modification time if no EXIF date
+    if date_taken is None:
+        date_taken = datetime.fromtimestamp(mtime if mtime is not None else os.path.getmtime(image_path))
+
+    return ExifInfo(coordinates, date_taken)
+
+
+def _prefetch_exif_windows(paths):
+    """Ask the kernel to start reading each file's EXIF window in the background.
+
+    Uses posix_fadvise(WILLNEED), so the reads for a whole batch are queued at
+    once and proceed while earlier files are being parsed. A no-op where
+    posix_fadvise isn't available.
+
+    Args:
+        paths (list[str]): Files about to be parsed.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, EXIF_WINDOW, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def extract_exif_batch(batch):
+    """Extract EXIF metadata for a batch of files, overlapping their reads with parsing.
+
+    Args:
+        batch (list[tuple[str, float]]): Files to extract, each with its st_mtime.
+
+    Returns:
+        list[ExifInfo]: `extract_exif_data` results, aligned with batch.
+    """
+    _prefetch_exif_windows([path for path, _ in batch])
+    return [extract_exif_data(path, mtime) for path, mtime in batch]
+
+
+def is_rotational_storage(path):
+    """Best-effort check whether a path lives on a spinning disk.
+
+    Reads the Linux sysfs `queue/rotational` flag for the block device backing
+    the path (or its parent device, for partitions). Any other platform, or a
+    device that can't be resolved, is reported as non-rotational.
+
+    Args:
+        path (str | Path): Any path on the filesystem to probe.
+
+    Returns:
+        bool: True if the backing device reports itself as rotational.
+    """
+    try:
+        dev = os.stat(path).st_dev
+        sys_dev = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+        for queue in (sys_dev / "queue", sys_dev.resolve().parent / "queue"):
+            rotational = queue / "rotational"
+            if rotational.exists():
+                return rotational.read_text().strip() == "1"
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def _copy_file_contents(src, dst):
+    """Copy the rest of src into dst, in-kernel via copy_file_range where supported.
+
+    If copy_file_range is unavailable or refused for this pair of files, the
+    copy carries on from the current offsets with a buffered userspace loop.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while os.copy_file_range(src.fileno(), dst.fileno(), MOVE_COPY_CHUNK):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                raise
+    shutil.copyfileobj(src, dst, MOVE_COPY_CHUNK)
+
+
+def _rename_exclusive(source_path, dest_path):
+    """Rename a file onto a name reserved first, so an existing file is never replaced.
+
+    os.rename silently replaces an existing destination on POSIX, so the name
+    is claimed with an O_EXCL create (which fails with FileExistsError if it
+    is taken) and the file is then renamed over that empty placeholder.
+
+    Raises:
+        FileExistsError: If dest_path already exists.
+    """
+    os.close(os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    try:
+        os.replace(source_path, dest_path)
+    except BaseException:
+        os.unlink(dest_path)
+        raise
+
+
+def move_file(source_path, dest_path, hardlinks=True):
+    """Move a file without ever overwriting an existing destination.
+
+    Hard-linking the destination and then unlinking the source moves the file
+    without touching its data, and unlike os.rename, which silently replaces
+    an existing file on POSIX, the link fails with FileExistsError if the name
+    was taken in the meantime. On filesystems without hard links (FAT/exFAT,
+    some network mounts) it falls back to `_rename_exclusive`, which reserves
+    the name before renaming onto it. Only when the move crosses filesystems
+    (EXDEV, e.g. a folder that is a mount point) is the file copied, with its
+    metadata, and the source removed afterwards.
+
+    Args:
+        source_path (str | Path): File to move.
+        dest_path (str | Path): Destination path; must not exist yet.
+        hardlinks (bool): Whether to try a hard link first. Pass False once a
+            link has failed as unsupported, so later moves go straight to the
+            exclusive rename instead of failing a link each time.
+
+    Returns:
+        bool: False if os.link reported hard links unsupported, else `hardlinks`.
+
+    Raises:
+        FileExistsError: If dest_path already exists.
+    """
+    try:
+        if hardlinks:
+            try:
+                os.link(source_path, dest_path)
+            except OSError as e:
+                if e.errno not in _NO_HARDLINK_ERRNOS:
+                    raise
+                hardlinks = False
+            else:
+                try:
+                    os.unlink(source_path)
+                except BaseException:
+                    os.unlink(dest_path)  # Don't leave the file under both names
+                    raise
+                return True
+        _rename_exclusive(source_path, dest_path)
+        return hardlinks
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    with open(source_path, 'rb') as src, open(dest_path, 'xb') as dst:
+        try:
+            _copy_file_contents(src, dst)
+        except BaseException:
+            dst.close()
+            os.unlink(dest_path)
+            raise
+    shutil.copystat(source_path, dest_path)
+    os.unlink(source_path)
+    return hardlinks
+
+
+def _free_name(name, used_names):
+    """Return name, or its first `{stem}_{n}{suffix}` variant that isn't in used_names."""
+    if name not in used_names:
+        return name
+    stem, suffix = os.path.splitext(name)
+    counter = 1
+    while f"{stem}_{counter}{suffix}" in used_names:
+        counter += 1
+    return f"{stem}_{counter}{suffix}"
+
+
+class _RateLimiter:
+    """Space out calls from any number of threads to at most `rate` per second.
+
+    Each caller reserves the next free slot under the lock, then sleeps until
+    that slot without holding it, so waiting callers don't block one another.
+    """
+
+    def __init__(self, rate):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller's reserved slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class PhotoLocationSorter:
     """Sorts and organizes photos by date and location.
 
     This class:
-    - Extracts EXIF GPS and date metadata (with lazy caching)
-    - Groups photos by approximate location using a search-based grouping strategy
+    - Extracts EXIF GPS and date metadata for all photos up front, in parallel and cached on disk
+    - Groups photos taken at approximately the same location on a coordinate grid
     - Optionally resolves human-readable place names via Google Geocoding API
     - Creates folders per date and location, then moves photos accordingly
     """
-    photo_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.raw', '.cr2', '.nef', '.arw', '.heic'}
-    
-    def __init__(self, source_folder, google_api_key=None):
+
+    def __init__(self, source_folder, google_api_key=None, max_workers=None):
         """Initialize the sorter.
 
         Args:
             source_folder (str | Path): Path to the folder containing photos.
             google_api_key (str | None): Optional API key for Google Geocoding.
                 If not provided, falls back to coordinate-based names.
+            max_workers (int | None): Number of EXIF extraction processes. None
+                picks a pool based on the CPU count and storage type; 1 extracts
+                in-process.
         """
         self.source_folder = Path(source_folder)
         self.google_api_key = google_api_key or (API_KEY if API_KEY != "YOUR_GOOGLE_MAPS_API_KEY" else None)
+        self.max_workers = max_workers
         
-        # Lazy caches - only populated as needed
-        self.location_cache = {}  # Cache for GPS coordinates
-        self.date_cache = {}  # Cache for dates
+        # In-memory caches for this run
+        self.metadata_cache = {}  # ExifInfo (GPS coordinates, date) per photo, filled in bulk by _extract_all
         self.geocoding_cache = {}  # Cache for reverse geocoding results
-        
-    def _extract_exif_data(self, image_path):
-        """Extract both GPS coordinates and date from EXIF data in a single pass.
+        self.location_names = {}  # Best folder name per rounded coordinate, for this run
+        self._session = None  # requests.Session for geocoding, created on first lookup
+        self._rate_limiter = _RateLimiter(GEOCODE_MAX_QPS)  # Shared by all geocoding threads
 
-        Uses exifread with minimal details to reduce overhead. Coordinates are
-        rounded to 4 decimals to stabilize grouping (~11m).
+        # On-disk caches so re-runs skip EXIF parsing and repeat geocoding calls
+        self.cache_db = sqlite3.connect(self.source_folder / CACHE_DB_NAME)
+        self.cache_db.execute("""
+            CREATE TABLE IF NOT EXISTS exif (
+                path TEXT PRIMARY KEY, mtime REAL, size INTEGER, lat REAL, lon REAL, date TEXT
+            )
+        """)
+        self.geocode_db = self._open_geocode_cache()
 
-        Args:
-            image_path (Path): Path to the image.
+    def _open_geocode_cache(self):
+        """Open the per-user geocoding cache under the user's cache directory.
+
+        The cache is shared by every folder sorted on this machine, so places
+        already named in one photo dump cost no API calls in the next. WAL mode
+        lets concurrent sorter runs read it while another one writes. Falls back
+        to an in-memory cache for this run if the user cache can't be opened
+        (no home directory, read-only or non-directory cache path).
 
         Returns:
-            tuple[tuple[float, float] | None, datetime]: (rounded (lat, lon) or None, date_taken).
-                Falls back to file modification time if EXIF date is missing.
+            sqlite3.Connection: Connection holding the geocode table.
+        """
+        schema = """
+            CREATE TABLE IF NOT EXISTS geocode (
+                lat REAL, lon REAL, name TEXT, PRIMARY KEY (lat, lon)
+            )
         """
+        path = db = None
         try:
-            with open(image_path, 'rb') as f:
-                # Extract all relevant tags in one pass for performance
-                tags = exifread.process_file(
-                    f, 
-                    details=False, 
-                    extract_thumbnail=False
-                )
-            
-            # Extract GPS coordinates
-            coordinates = None
-            gps_lat = tags.get('GPS GPSLatitude')
-            gps_lat_ref = tags.get('GPS GPSLatitudeRef')
-            gps_lon = tags.get('GPS GPSLongitude')
-            gps_lon_ref = tags.get('GPS GPSLongitudeRef')
-            
-            if all([gps_lat, gps_lat_ref, gps_lon, gps_lon_ref]):
-                try:
-                    # Convert GPS coordinates to decimal degrees
-                    lat = self._convert_to_degrees(gps_lat)
-                    if gps_lat_ref.values[0] != 'N':
-                        lat = -lat
-                        
-                    lon = self._convert_to_degrees(gps_lon)
-                    if gps_lon_ref.values[0] != 'E':
-                        lon = -lon
-                        
-                    # Round to reduce precision for grouping (approximately 11m accuracy)
-                    coordinates = (round(lat, 4), round(lon, 4))
-                except Exception as e:
-                    logger.warning(f"Error converting GPS coordinates for {image_path.name}: {e}")
-            
-            # Extract date
-            date_taken = None
-            date_tags = ['EXIF DateTimeOriginal', 'EXIF DateTime', 'Image DateTime']
-            
-            for tag_name in date_tags:
-                if tag_name in tags:
-                    date_str = str(tags[tag_name])
-                    try:
-                        date_taken = datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                        break
-                    except ValueError:
-                        continue
-            
-            # Fallback to file modification time if no EXIF date
-            if date_taken is None:
-                date_taken = datetime.fromtimestamp(os.path.getmtime(image_path))
-            
-            return coordinates, date_taken
-            
-        except Exception as e:
-            logger.warning(f"Error reading EXIF from {image_path.name}: {e}")
-            # Return fallback values
-            return None, datetime.fromtimestamp(os.path.getmtime(image_path))
-    
-    def get_location_lazy(self, image_path):
-        """Return cached GPS coordinates or extract on demand.
+            path = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / GEOCODE_CACHE_NAME
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(schema)
+        except (OSError, RuntimeError, sqlite3.Error) as e:
+            logger.warning(f"Can't open geocoding cache {path or GEOCODE_CACHE_NAME}, keeping it in memory: {e}")
+            if db is not None:
+                db.close()
+            db = sqlite3.connect(':memory:')
+            db.execute(schema)
+        return db
+
+    def close(self):
+        """Close the on-disk cache databases and the geocoding HTTP session."""
+        self.geocode_db.close()
+        self.cache_db.close()
+        if self._session is not None:
+            self._session.close()
+
+    def _load_persisted_metadata(self, photo_entries):
+        """Fill metadata_cache from the on-disk cache for files unchanged since stored.
+
+        A stored row is only reused when the file's mtime and size still match.
 
         Args:
-            image_path (Path): Image path.
+            photo_entries (list[tuple[str, os.stat_result]]): Photos not yet in
+                metadata_cache, with the stat result taken while scanning.
 
         Returns:
-            tuple[float, float] | None: Rounded (lat, lon) if available; else None.
+            list[tuple[str, os.stat_result]]: Photos that still need extraction,
+                with the stat result to persist alongside their metadata.
         """
-        if image_path not in self.location_cache:
-            coordinates, date_taken = self._extract_exif_data(image_path)
-            self.location_cache[image_path] = coordinates
-            self.date_cache[image_path] = date_taken
-        return self.location_cache[image_path]
-    
-    def get_date_lazy(self, image_path):
-        """Return cached date or extract on demand.
+        persisted = {
+            path: row for path, *row in self.cache_db.execute(
+                "SELECT path, mtime, size, lat, lon, date FROM exif"
+            )
+        }
+
+        misses = []
+        for image_path, st in photo_entries:
+            row = persisted.get(image_path)
+            if row is not None and row[0] == st.st_mtime and row[1] == st.st_size:
+                _, _, lat, lon, date = row
+                coordinates = (lat, lon) if lat is not None else None
+                self.metadata_cache[image_path] = ExifInfo(coordinates, datetime.fromisoformat(date))
+            else:
+                misses.append((image_path, st))
+        return misses
+
+    def _persist_metadata(self, rows):
+        """Write a batch of exif rows to the on-disk cache in a single transaction."""
+        if rows:
+            with self.cache_db:
+                self.cache_db.executemany("INSERT OR REPLACE INTO exif VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def _forget_metadata(self, paths):
+        """Drop the exif rows of files that no longer live at their stored path, in one transaction.
+
+        Scans only look at the top level of the source folder, so rows for photos
+        moved into subfolders would never match again; pruning them keeps the
+        table (which is read in full on every run) down to not-yet-sorted files.
+        """
+        if paths:
+            with self.cache_db:
+                self.cache_db.executemany("DELETE FROM exif WHERE path = ?", ((p,) for p in paths))
+
+    def _extract_all(self, photo_entries):
+        """Extract EXIF metadata for every photo in parallel and fill the caches.
+
+        Photos whose metadata was persisted by an earlier run (and that haven't
+        changed since) are served from the on-disk cache. The rest are parsed
+        independently, so extraction fans out over a process pool sized to the
+        CPU count. Spinning disks degrade badly under concurrent seeks, so on
+        rotational storage a 2-thread pool is used instead. Each task covers
+        EXIF_PREFETCH_BATCH files whose headers are read ahead while the batch
+        is parsed; the pool never has more workers than there are batches, and a
+        single batch is extracted without spawning any processes. An explicit
+        max_workers overrides the automatic pool choice. New results
+        are written back in batches of CACHE_COMMIT_BATCH rows.
 
         Args:
-            image_path (Path): Image path.
+            photo_entries (list[tuple[str, os.stat_result]]): Photos to extract, with
+                their stat results from the directory scan; already-cached paths are skipped.
+        """
+        misses = self._load_persisted_metadata(
+            [(p, st) for p, st in photo_entries if p not in self.metadata_cache]
+        )
+        if not misses:
+            return
+        pending = [(image_path, st.st_mtime) for image_path, st in misses]
+
+        batches = [pending[i:i + EXIF_PREFETCH_BATCH] for i in range(0, len(pending), EXIF_PREFETCH_BATCH)]
+        if len(batches) == 1 or self.max_workers == 1:
+            # A single batch gains nothing from a pool, and spawning one costs more than the batch
+            executor = ThreadPoolExecutor(max_workers=1)
+        elif self.max_workers is not None:
+            executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(batches)))
+        elif is_rotational_storage(self.source_folder):
+            executor = ThreadPoolExecutor(max_workers=2)
+        else:
+            executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(batches)))
+
+        rows = []
+        with executor:
+            results = chain.from_iterable(executor.map(extract_exif_batch, batches))
+            progress = tqdm(zip(misses, results), total=len(misses), desc="EXIF", unit="photo")
+            for (image_path, st), info in progress:
+                self.metadata_cache[image_path] = info
+                lat, lon = info.coordinates or (None, None)
+                rows.append((image_path, st.st_mtime, st.st_size, lat, lon, info.date_taken.isoformat()))
+                if len(rows) >= CACHE_COMMIT_BATCH:
+                    self._persist_metadata(rows)
+                    rows = []
+        self._persist_metadata(rows)
+
+    def get_metadata_lazy(self, image_path):
+        """Return cached metadata or extract coordinates and date on demand in one read.
+
+        Args:
+            image_path (str | Path): Image path.
 
         Returns:
-            datetime: Date/time the photo was taken or file mtime fallback.
+            ExifInfo: As returned by `extract_exif_data`.
         """
-        if image_path not in self.date_cache:
-            coordinates, date_taken = self._extract_exif_data(image_path)
-            self.location_cache[image_path] = coordinates
-            self.date_cache[image_path] = date_taken
-        return self.date_cache[image_path]
-    
-    def _convert_to_degrees(self, value):
-        """Convert GPS coordinates from DMS to decimal degrees.
+        image_path = os.fspath(image_path)  # The cache is keyed by str paths
+        try:
+            return self.metadata_cache[image_path]
+        except KeyError:
+            info = self.metadata_cache[image_path] = extract_exif_data(image_path)
+            return info
+
+    def get_location_lazy(self, image_path):
+        """Return cached GPS coordinates or extract on demand.
 
         Args:
-            value: EXIF rational triplet for degrees, minutes, seconds.
+            image_path (str | Path): Image path.
 
         Returns:
-            float: Decimal degrees.
+            tuple[float, float] | None: Rounded (lat, lon) if available; else None.
         """
-        d, m, s = value.values
-        return float(d) + float(m)/60.0 + float(s)/3600.0
+        return self.get_metadata_lazy(image_path).coordinates
     
-    @staticmethod
-    def are_locations_same(coord1, coord2, tolerance=0.01):
-        """Heuristically determine if two coordinates represent the same place.
-
-        Compares each component within the given tolerance. If either is None,
-        equality requires both to be None (no-location bucket).
+    def get_date_lazy(self, image_path):
+        """Return cached date or extract on demand.
 
         Args:
-            coord1 (tuple[float, float] | None): First coordinate.
-            coord2 (tuple[float, float] | None): Second coordinate.
-            tolerance (float): Allowed difference in degrees per axis.
+            image_path (str | Path): Image path.
 
         Returns:
-            bool: True if considered the same location.
+            datetime: Date/time the photo was taken or file mtime fallback.
         """
-        if coord1 is None or coord2 is None:
-            return coord1 == coord2  # Both None or one is None
-        
-        lat_diff = abs(coord1[0] - coord2[0])
-        lon_diff = abs(coord1[1] - coord2[1])
-        
-        return lat_diff <= tolerance and lon_diff <= tolerance
+        return self.get_metadata_lazy(image_path).date_taken
     
-    def find_location_group_end(self, photos, start_index):
-        """Find the exclusive end index of a contiguous location group.
+    @staticmethod
+    def grid_cells(coords, tolerance=0.01):
+        """Quantize coordinates onto a grid of `tolerance`-degree cells, as one integer key per photo.
 
-        Strategy:
-        - Start from start_index and perform an exponential search (step=8, doubling)
-          to quickly find an upper bound where location changes.
-        - Use binary search within the discovered range to find the first differing index.
-        - Returns the exclusive end index of the group starting at start_index.
+        Photos landing in the same cell share a location group wherever they
+        fall in the chronological order, so the whole assignment is one
+        vectorized rounding pass. It runs on int32 coordinates in 1e-4 degree
+        units (exact, since coordinates carry 4 decimals), so a point on a cell
+        edge always rounds up instead of wherever float division puts it. Like
+        an integer geohash, a cell's (lat, lon) indices are packed into a single
+        int64 (latitude in the high 32 bits), so keys hash and compare as plain
+        ints and sort in (lat, lon) cell order.
 
         Args:
-            photos (list[Path]): Sorted list of photo paths.
-            start_index (int): Index where the group begins.
+            coords (np.ndarray): (n, 2) array of (lat, lon), NaN rows for photos without GPS.
+            tolerance (float): Grid cell size in degrees (0.01 is about 1.1km).
 
         Returns:
-            int: Exclusive end index for the group.
+            np.ndarray: int64 grid key of each photo; NO_LOCATION_CELL for photos
+                without GPS (no-location bucket).
         """
-        if start_index >= len(photos):
-            return start_index
-        
-        start_location = self.get_location_lazy(photos[start_index])
-        
-        # If no location data, treat as single-item group
-        if start_location is None:
-            return start_index + 1
-        
-        # Exponential search to find upper bound
-        left = start_index + 1
-        right = len(photos)
-        step = 8  # Start with 8th photo for faster skipping over long same-location runs
-        
-        current = start_index + step
-        while current < len(photos):
-            current_location = self.get_location_lazy(photos[current])
-            
-            if not self.are_locations_same(start_location, current_location):
-                right = current
-                break
-            
-            left = current
-            step *= 2
-            current = start_index + step
-        
-        # Binary search between left and right to locate first differing index
-        while left < right:
-            mid = (left + right) // 2
-            mid_location = self.get_location_lazy(photos[mid])
-            
-            if self.are_locations_same(start_location, mid_location):
-                left = mid + 1
-            else:
-                right = mid
-        
-        return left
+        scaled = np.rint(np.nan_to_num(coords) * COORD_SCALE).astype(np.int32)
+        step = max(1, round(tolerance * COORD_SCALE))
+        cells = ((scaled + step // 2) // step).astype(np.int64)  # Nearest cell, halves rounding up
+        keys = cells[:, 0] * (1 << 32) + (cells[:, 1] + (1 << 31))
+        keys[np.isnan(coords[:, 0])] = NO_LOCATION_CELL
+        return keys
     
     def get_location_name(self, coordinates):
         """Generate a simple coordinate-based name.
@@ -239,35 +1281,57 @@ class PhotoLocationSorter:
         if coordinates is None:
             return "no_location"
         
-        lat, lon = coordinates
-        lat_dir = "N" if lat >= 0 else "S"
-        lon_dir = "E" if lon >= 0 else "W"
-        
-        return f"{abs(lat):.4f}{lat_dir}_{abs(lon):.4f}{lon_dir}"
+        return _coordinate_name(coordinates)
     
 
-    def get_location_name_from_google(self, coordinates, prefer_locality=True):
-        """Resolve a human-readable name using Google Geocoding API with caching.
+    def _geocoding_session(self):
+        """Return the HTTP session shared by all geocoding lookups, creating it on first use.
 
-        Prefers city/locality names when available; falls back to formatted address.
-        Results are cached by rounded coordinate string (~11m).
+        Reusing one session keeps the TCP/TLS connection to the API alive
+        across lookups instead of handshaking for each one.
+        """
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def _is_location_cached(self, coord_key, coordinates):
+        """Check the in-memory then on-disk geocoding caches, promoting disk hits to memory."""
+        if coord_key in self.geocoding_cache:
+            return True
+        row = self.geocode_db.execute(
+            "SELECT name FROM geocode WHERE lat = ? AND lon = ?", coordinates
+        ).fetchone()
+        if row is not None:
+            self.geocoding_cache[coord_key] = row[0]
+            return True
+        return False
+
+    def _store_location_names(self, resolved):
+        """Cache resolved (coordinates, name) pairs, persisting non-None names in one transaction."""
+        for coordinates, location_name in resolved:
+            self.geocoding_cache[f"{coordinates[0]:.4f},{coordinates[1]:.4f}"] = location_name
+        rows = [(lat, lon, name) for (lat, lon), name in resolved if name is not None]
+        if rows:
+            with self.geocode_db:
+                self.geocode_db.executemany("INSERT OR REPLACE INTO geocode VALUES (?, ?, ?)", rows)
+
+    def _fetch_location_name(self, coordinates, prefer_locality=True):
+        """Query the Google Geocoding API for one coordinate, without touching the caches.
+
+        Safe to call from worker threads: it only uses the shared HTTP session
+        and rate limiter, which keeps concurrent lookups under GEOCODE_MAX_QPS.
 
         Args:
             coordinates (tuple[float, float]): Rounded (lat, lon).
             prefer_locality (bool): If True, prefer city/locality when present.
 
         Returns:
-            str | None: Resolved location name or None if unavailable/errored.
+            tuple[str | None, bool]: The resolved name (or None), and whether the
+                answer should be cached; HTTP and network errors are not cached
+                so a later lookup can retry.
         """
-        if not coordinates or not all(isinstance(c, (int, float)) for c in coordinates):
-            logging.warning("Invalid or missing coordinates provided.")
-            return None
-        
         coord_key = f"{coordinates[0]:.4f},{coordinates[1]:.4f}"
-        
-        if coord_key in self.geocoding_cache:
-            return self.geocoding_cache[coord_key]
-        
         params = {
             'latlng': f"{coordinates[0]},{coordinates[1]}",
             'key': self.google_api_key
@@ -275,13 +1339,16 @@ class PhotoLocationSorter:
 
         try:
             import requests
-            response = requests.get("https://maps.googleapis.com/maps/api/geocode/json", params=params)
+            self._rate_limiter.wait()
+            response = self._geocoding_session().get(
+                "https://maps.googleapis.com/maps/api/geocode/json", params=params
+            )
             
             if response.status_code != 200:
                 logging.warning(
                     f"HTTP Error {response.status_code} for {coord_key}: {response.text}"
                 )
-                return None
+                return None, False
 
             data = response.json()
 
@@ -289,13 +1356,11 @@ class PhotoLocationSorter:
                 logging.info(
                     f"API Error for {coord_key}. Status: {data['status']}"
                 )
-                self.geocoding_cache[coord_key] = None
-                return None
+                return None, True
             
             if not data.get('results'):
                 logging.info(f"API status OK but no results for {coord_key}")
-                self.geocoding_cache[coord_key] = None
-                return None
+                return None, True
                 
             first_result = data['results'][0]
             location_name = None
@@ -310,24 +1375,95 @@ class PhotoLocationSorter:
             if location_name is None:
                 location_name = first_result.get('formatted_address')
 
-            self.geocoding_cache[coord_key] = location_name
-            return location_name
+            return location_name, True
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Geocoding network error for {coord_key}: {e}")
+            return None, False
+
+    def get_location_name_from_google(self, coordinates, prefer_locality=True):
+        """Resolve a human-readable name using Google Geocoding API with caching.
+
+        Prefers city/locality names when available; falls back to formatted address.
+        Results are cached by rounded coordinate string (~11m), and successful
+        lookups are persisted to the on-disk cache for later runs.
+
+        Args:
+            coordinates (tuple[float, float]): Rounded (lat, lon).
+            prefer_locality (bool): If True, prefer city/locality when present.
+
+        Returns:
+            str | None: Resolved location name or None if unavailable/errored.
+        """
+        if not coordinates or not all(isinstance(c, (int, float)) for c in coordinates):
+            logging.warning("Invalid or missing coordinates provided.")
             return None
+        
+        coord_key = f"{coordinates[0]:.4f},{coordinates[1]:.4f}"
+        if self._is_location_cached(coord_key, coordinates):
+            return self.geocoding_cache[coord_key]
+
+        location_name, cacheable = self._fetch_location_name(coordinates, prefer_locality)
+        if cacheable:
+            self._store_location_names([(coordinates, location_name)])
+        return location_name
+
+    def prefetch_location_names(self, coordinates_list, prefer_locality=True):
+        """Resolve many coordinates through the Geocoding API concurrently.
+
+        Only unique coordinates missing from both caches are requested; those
+        lookups run on GEOCODE_WORKERS threads sharing one keep-alive session,
+        throttled together to GEOCODE_MAX_QPS.
+        Results are cached on the calling thread (the sqlite connection isn't
+        shared across threads), so later `get_location_name_from_google` calls
+        for these coordinates are cache hits.
+
+        Args:
+            coordinates_list (Iterable[tuple[float, float] | None]): Coordinates to resolve;
+                None entries are skipped.
+            prefer_locality (bool): If True, prefer city/locality when present.
+        """
+        pending = [
+            coordinates for coordinates in dict.fromkeys(coordinates_list)
+            if coordinates and not self._is_location_cached(
+                f"{coordinates[0]:.4f},{coordinates[1]:.4f}", coordinates
+            )
+        ]
+        if not pending:
+            return
+
+        self._geocoding_session()  # Created here so worker threads don't race to create it
+        with ThreadPoolExecutor(max_workers=min(GEOCODE_WORKERS, len(pending))) as executor:
+            results = executor.map(lambda c: self._fetch_location_name(c, prefer_locality), pending)
+            resolved = [
+                (coordinates, location_name)
+                for coordinates, (location_name, cacheable) in tqdm(
+                    zip(pending, results), total=len(pending), desc="Geocoding", unit="place"
+                )
+                if cacheable
+            ]
+        self._store_location_names(resolved)
 
     
     def get_best_location_name(self, coordinates):
         """Return the best available location name.
 
-        Uses the Google Geocoding API if configured; otherwise falls back to
-        coordinate-based naming.
+        Uses the Google Geocoding API if configured; otherwise, and whenever
+        the API yields no name, falls back to coordinate-based naming. Answers
+        are memoized per coordinate for the run, so a lookup that failed (and
+        so wasn't cached) isn't sent to the API again for the same place.
         """
-        if self.google_api_key:
-            return self.get_location_name_from_google(coordinates)
-        else:
-            return self.get_location_name(coordinates)
+        try:
+            return self.location_names[coordinates]
+        except KeyError:
+            pass
+        location_name = None
+        if self.google_api_key and coordinates is not None:
+            location_name = self.get_location_name_from_google(coordinates)
+        if location_name is None:
+            location_name = self.get_location_name(coordinates)
+        self.location_names[coordinates] = location_name
+        return location_name
     
     def process_photos(self):
         """Sort photos by date and group by location, then move into folders.
@@ -335,18 +1471,30 @@ class PhotoLocationSorter:
         Flow:
         - Gather candidate photo files by supported extensions
         - Sort by modification time (proxy for date when EXIF missing)
-        - Group by location using search-based grouping
+        - Extract EXIF metadata for all photos in parallel
+        - Bucket photos by location on a coordinate grid
         - Resolve location names (API if enabled)
-        - Create date_location folders and move photos
+        - Order photos by (grid cell, day) and stream each run into its date_location folder
         """
         logger.info(f"Starting to process photos in {self.source_folder}")
         
-        # Get all photo files (sorted by modification time as proxy for date)
-        photo_files = sorted(
-            [p for p in self.source_folder.iterdir() 
-             if p.is_file() and p.suffix.lower() in self.photo_extensions],
-            key=lambda x: os.path.getmtime(x)
-        )
+        # Get all photo files in a single directory read, stat'ing each once; the
+        # stat result serves the mtime sort (proxy for date), the cache check and the date fallback.
+        # Most non-photos fail the last-character check before any lowercasing, and
+        # symlinks are skipped rather than stat'ed through
+        photo_last_chars = _PHOTO_LAST_CHARS
+        photo_suffixes = _PHOTO_SUFFIXES
+        with os.scandir(self.source_folder) as entries:
+            scanned = [
+                (e.path, e.name, e.stat()) for e in entries
+                if e.name[-1] in photo_last_chars
+                and e.name.lower().endswith(photo_suffixes)
+                and e.is_file(follow_symlinks=False)
+            ]
+        scanned.sort(key=lambda entry: entry[2].st_mtime_ns)  # Integer keys compare faster, and exactly
+        photo_entries = [(image_path, st) for image_path, _, st in scanned]
+        photo_files = [image_path for image_path, _, _ in scanned]
+        photo_names = [name for _, name, _ in scanned]  # File names as listed, so moves needn't re-split paths
         
         if not photo_files:
             logger.warning("No photo files found!")
@@ -354,93 +1502,166 @@ class PhotoLocationSorter:
         
         num = len(photo_files)
         logger.info(f"Found {num} photos")
+
+        # Pre-extract EXIF for all photos in parallel so grouping only hits the caches
+        logger.info("Extracting EXIF metadata...")
+        self._extract_all(photo_entries)
+        # Resolve each photo's cached ExifInfo once, aligned with photo_files
+        metadata = [self.metadata_cache[p] for p in photo_files]
         
-        # Group photos by location using binary search technique
+        # One column per field, aligned with photo_files, rather than a record per photo
+        dates = np.array([info.date_taken for info in metadata], dtype='datetime64[s]')
+        coords = np.array(
+            [info.coordinates or (np.nan, np.nan) for info in metadata],
+            dtype=np.float64
+        )
+
+        # Name each grid cell once, from the first photo (in mtime order) that falls in it;
+        # one np.unique call yields each photo's cell id and each cell's first photo
         logger.info("Grouping photos by location...")
-        location_groups = defaultdict(list)
-        
-        i = 0
-        processed = 0
-        while i < len(photo_files):
-            group_end = self.find_location_group_end(photo_files, i)
-            
-            # Get the location for this group
-            location = self.get_location_lazy(photo_files[i])
-            
-            # Get location name once per group (with Google API if available)
-            location_name = self.get_best_location_name(location)
-            
-            # Add all photos in this group to the location
-            for j in range(i, group_end):
-                photo_path = photo_files[j]
-                date_taken = self.get_date_lazy(photo_path)
-                
-                location_groups[location_name].append({
-                    'path': photo_path,
-                    'date': date_taken,
-                    'coordinates': location
-                })
-            
-            processed += (group_end - i)
-            if processed % 100 == 0 or processed == num:
-                logger.info(f"Processed {processed}/{num} photos")
-            
-            i = group_end
-        
+        _, first_index, cell_ids = np.unique(self.grid_cells(coords), return_index=True, return_inverse=True)
+        representatives = [metadata[index].coordinates for index in first_index.tolist()]
+        if self.google_api_key:
+            # Resolve every cell's name up front, concurrently; naming below then hits the cache
+            self.prefetch_location_names(representatives)
+        cell_names = [self.get_best_location_name(coordinates) for coordinates in representatives]
+        logger.info(f"Found {len(set(cell_names))} location groups")
+
+        # Order photos by (grid cell, day) so every destination folder is one contiguous run;
+        # lexsort is stable, so photos keep their mtime order within a folder
+        days = dates.astype('datetime64[D]').astype(np.int64)  # Days since the epoch
+        order = np.lexsort((days, cell_ids))
+        run_cells = cell_ids[order]
+        run_days = days[order]
+        # A run starts wherever the cell or the day changes from the previous photo
+        starts = np.flatnonzero((np.diff(run_cells) != 0) | (np.diff(run_days) != 0)) + 1
+        bounds = [0, *starts.tolist(), num]
+        order = order.tolist()
+        run_cells = run_cells.tolist()
+        run_days = run_days.tolist()
+
+        # Stream one (folder, photos) run at a time into the mover, formatting each
+        # folder's name once per run; a run's path list is dropped once it's moved
+        folder_runs = (
+            (
+                f"{np.datetime64(run_days[start], 'D')}_{cell_names[run_cells[start]]}",
+                [(photo_files[i], photo_names[i]) for i in order[start:end]]
+            )
+            for start, end in zip(bounds, bounds[1:])
+        )
+
         # Create folders and move photos
-        logger.info(f"Found {len(location_groups)} location groups")
-        self.create_folders_and_move_photos(location_groups)
+        self.create_folders_and_move_photos(folder_runs)
     
-    def create_folders_and_move_photos(self, location_groups):
-        """Create subfolders and move photos based on location and date.
+    def create_folders_and_move_photos(self, folder_runs):
+        """Create subfolders and move photos into them in a single pass.
 
-        For each location group:
-        - Partition photos by date (YYYY-MM-DD)
-        - Create a folder named `{date}_{location_name}`
-        - Move photos into the corresponding folder, handling duplicate filenames
+        Takes one run of photos per `{date}_{location_name}` folder, as
+        `process_photos` produces by sorting on grid cell and day. Folders are
+        created and duplicate filenames resolved on the calling thread, as each
+        run is reached; a folder that recurs (two cells resolving to the same
+        name) reuses the names it already holds. The moves themselves run on
+        MOVE_WORKERS threads, so the filesystem sees many at once (which network
+        shares and SSDs handle far faster than one at a time). At most
+        MOVE_WINDOW moves are queued at any time, so only that many photos (and
+        the run being read) are held in memory, and an interrupt stops after the
+        moves already in flight. A name taken meanwhile by another program is
+        retried on the calling thread.
+
+        Destination folders live inside the source folder, so moves never copy
+        data except where a folder is a mount point, and never overwrite a file.
+
+        Args:
+            folder_runs (Iterable[tuple[str, list[tuple[str, str]]]]): (folder name,
+                [(path, file name), ...] to move into it) pairs; a folder name may
+                appear more than once.
         """
-        for location_name, photos in location_groups.items():
-            if not photos:
-                continue
-            
-            # Group photos by date for this location
-            date_groups = defaultdict(list)
-            for photo_info in photos:
-                date_key = photo_info['date'].strftime('%Y-%m-%d')
-                date_groups[date_key].append(photo_info)
-            
-            # Create folders and move photos for each date
-            for date_key, date_photos in date_groups.items():
-                folder_name = f"{date_key}_{location_name}"
-                folder_path = self.source_folder / folder_name
-                
-                # Create folder if it doesn't exist
-                folder_path.mkdir(exist_ok=True)
-                
-                # Move photos to the folder
-                moved_count = 0
-                for photo_info in date_photos:
+        source_dir = os.fspath(self.source_folder)
+        folder_used_names = {}  # folder name -> file names already taken in it
+        moved_paths = []
+        # Cleared once os.link itself fails as unsupported (a failed unlink or copy leaves it
+        # set); later moves then use move_file's exclusive rename, which never replaces a file
+        hardlinks = True
+
+        def move(source_path, dest_path):
+            """Move one photo on a worker thread, returning the error instead of raising it."""
+            nonlocal hardlinks
+            try:
+                hardlinks = move_file(source_path, dest_path, hardlinks) and hardlinks
+            except Exception as e:
+                return e
+            return None
+
+        def finish(queued):
+            """Collect one queued move, retrying a lost name, and log its folder once done."""
+            run_state, source_path, name, dest_name, future = queued
+            error = future.result()
+            try:
+                while isinstance(error, FileExistsError):
+                    # Appeared since the folder was listed; never overwrite it
+                    dest_name = _free_name(name, run_state['used_names'])
+                    run_state['used_names'].add(dest_name)
+                    error = move(source_path, os.path.join(run_state['folder_dir'], dest_name))
+                if error is not None:
+                    raise error
+                moved_paths.append(source_path)
+                run_state['moved'] += 1
+
+            except Exception as e:
+                logger.error(f"Error moving {name}: {e}")
+
+            run_state['left'] -= 1
+            if not run_state['left']:
+                logger.info(f"Moved {run_state['moved']} photos to {run_state['folder_name']}")
+
+        executor = ThreadPoolExecutor(max_workers=MOVE_WORKERS)
+        queue = deque()  # (run state, path, file name, dest name, future), oldest first
+        try:
+            for folder_name, run in folder_runs:
+                folder_dir = os.path.join(source_dir, folder_name)
+                used_names = folder_used_names.get(folder_name)
+                if used_names is None:
+                    # Create the folder once; a folder that had to be created is empty, so only
+                    # an existing one is listed for the names already taken (instead of a stat per probe)
                     try:
-                        source_path = photo_info['path']
-                        dest_path = folder_path / source_path.name
-                        
-                        # Handle duplicate filenames
-                        counter = 1
-                        while dest_path.exists():
-                            dest_path = folder_path / f"{source_path.stem}_{counter}{source_path.suffix}"
-                            counter += 1
-                        
-                        shutil.move(str(source_path), str(dest_path))
-                        moved_count += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error moving {source_path.name}: {e}")
-                
-                logger.info(f"Moved {moved_count} photos to {folder_name}")
+                        os.mkdir(folder_dir)
+                        used_names = set()
+                    except FileExistsError:
+                        with os.scandir(folder_dir) as entries:
+                            used_names = {e.name for e in entries}
+                    folder_used_names[folder_name] = used_names
+
+                # Reserve each destination name on this thread (handling duplicate filenames), then
+                # hand the move to the pool (no data is copied unless it crosses filesystems)
+                run_state = {'folder_name': folder_name, 'folder_dir': folder_dir,
+                             'used_names': used_names, 'moved': 0, 'left': len(run)}
+                for source_path, name in run:
+                    dest_name = _free_name(name, used_names)
+                    used_names.add(dest_name)
+                    future = executor.submit(move, source_path, os.path.join(folder_dir, dest_name))
+                    queue.append((run_state, source_path, name, dest_name, future))
+                    if len(queue) >= MOVE_WINDOW:
+                        finish(queue.popleft())
+            while queue:
+                finish(queue.popleft())
+        except BaseException:
+            # Drop the moves that haven't started; only those already running complete
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            # Moved photos won't be scanned under their old paths again
+            self._forget_metadata(moved_paths)
 
 def main():
     """CLI entry point to execute the photo sorter interactively."""
-    
+    parser = argparse.ArgumentParser(description="Sort photos into date_location folders.")
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                        help="EXIF extraction processes (default: CPU count, 2 threads on spinning disks)")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     # Get source folder from user
     source_folder = input("Enter the path to your photo dump folder: ").strip()
     
@@ -465,8 +1686,8 @@ def main():
     print("This may take a while for large photo collections...")
     
     try:
-        sorter = PhotoLocationSorter(source_folder, google_api_key)
-        sorter.process_photos()
+        with closing(PhotoLocationSorter(source_folder, google_api_key, max_workers=args.workers)) as sorter:
+            sorter.process_photos()
         print("\nPhoto sorting completed successfully!")
         
     except KeyboardInterrupt: